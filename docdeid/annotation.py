@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any, Callable, Optional
 
 from frozendict import frozendict
@@ -67,6 +68,10 @@ class Annotation:  # pylint: disable=R0902
             "length": self.length,
         }
 
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        object.__setattr__(self, "_key_cache", {})
+
     def get_sort_key(
         self,
         by: tuple,  # pylint: disable=C0103
@@ -174,7 +179,7 @@ class AnnotationSet(set[Annotation]):
             ``True`` if overlapping annotations are found, ``False`` otherwise.
         """
 
-        annotations = self.sorted(by=("start_char",))
+        annotations = sorted(self, key=attrgetter("start_char", "end_char"))
 
         for annotation, next_annotation in zip(annotations, annotations[1:]):
 
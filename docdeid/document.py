@@ -1,3 +1,4 @@
+import re
 from collections import defaultdict
 from collections.abc import Mapping
 from dataclasses import dataclass
@@ -8,6 +9,8 @@ from frozendict import frozendict
 from docdeid.annotation import Annotation, AnnotationSet
 from docdeid.tokenizer import Token, Tokenizer, TokenList
 
+_DIGIT_RX = re.compile(r"\d")
+
 
 class MetaData:
     """
@@ -74,8 +77,8 @@ class Document:
     @dataclass
     class AnnosByToken:
         """A cache entry associating an `AnnotationSet` with a token->annos map."""
-        anno_set: AnnotationSet
-        value: defaultdict[Token, set[Annotation]]
+        anno_set: Optional[AnnotationSet]
+        value: Optional[defaultdict[Token, set[Annotation]]]
 
     def __init__(
         self,
@@ -94,9 +97,21 @@ class Document:
         with directly."""
 
         self._token_lists: dict[str, TokenList] = {}
+        self._has_digits: Optional[bool] = None
         self._annotations = AnnotationSet()
         self._deidentified_text: Optional[str] = None
 
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+
+        # Derived from the text and annotations, and relying on token links that are
+        # not serialized, so these are recomputed when needed.
+        state["_token_lists"] = {}
+        state["_default_annos_by_token"] = Document.AnnosByToken(None, None)
+        state["_tmp_annos_by_token"] = Document.AnnosByToken(None, None)
+
+        return state
+
     @property
     def text(self) -> str:
         """
@@ -107,6 +122,19 @@ class Document:
         """
         return self._text
 
+    @property
+    def has_digits(self) -> bool:
+        """
+        Whether the document text contains any digits. Evaluates lazily.
+
+        Returns:
+            ``True`` if at least one character of the text is a digit, ``False``
+            otherwise.
+        """
+        if self._has_digits is None:
+            self._has_digits = _DIGIT_RX.search(self._text) is not None
+        return self._has_digits
+
     @property
     def tokenizers(self) -> Mapping[str, Tokenizer]:
         """Available tokenizers indexed by their name."""
@@ -187,7 +215,7 @@ class Document:
             cache = self._tmp_annos_by_token
 
         # Try to use a cached response.
-        if eff_annos == cache.anno_set:
+        if eff_annos == cache.anno_set and cache.value is not None:
             return cache.value
 
         # Compute the return value.
@@ -3,10 +3,16 @@ from __future__ import annotations
 import codecs
 import itertools
 from collections.abc import Sequence
-from typing import Iterable, Iterator, Optional, Union
+from typing import Callable, Iterable, Iterator, Optional, Union
 
 from docdeid.ds.ds import Datastructure
-from docdeid.str.processor import StringModifier, StringProcessor, StripString
+from docdeid.str.processor import (
+    StringModifier,
+    StringProcessor,
+    StripString,
+    compose_modifiers,
+    map_modifiers,
+)
 
 
 class LookupStructure(Datastructure):  # pylint: disable=R0903
@@ -23,24 +29,28 @@ class LookupStructure(Datastructure):  # pylint: disable=R0903
     def __init__(
         self, matching_pipeline: Optional[list[StringModifier]] = None
     ) -> None:
+        self._matching_pipeline: Optional[list[StringModifier]] = None
+        self._apply_matching_pipeline: Callable[[str], str] = compose_modifiers(None)
         self.matching_pipeline = matching_pipeline
 
-    def _apply_matching_pipeline(self, item: str) -> str:
+    @property
+    def matching_pipeline(self) -> Optional[list[StringModifier]]:
+        """The matching pipeline, if any."""
+        return self._matching_pipeline
+
+    @matching_pipeline.setter
+    def matching_pipeline(
+        self, matching_pipeline: Optional[list[StringModifier]]
+    ) -> None:
         """
-        Apply a matching pipeline to an item.
+        Set the matching pipeline, and compose it into a single callable that can be
+        applied to an item.
 
         Args:
-            item: The input string.
-
-        Returns:
-            The string, modified by the matching pipeline.
+            matching_pipeline: The new matching pipeline.
         """
-
-        if self.matching_pipeline is not None:
-            for processor in self.matching_pipeline:
-                item = processor.process(item)
-
-        return item
+        self._matching_pipeline = matching_pipeline
+        self._apply_matching_pipeline = compose_modifiers(matching_pipeline)
 
     def has_matching_pipeline(self) -> bool:
         """
@@ -89,8 +99,7 @@ class LookupSet(LookupStructure):
             for processor in cleaning_pipeline:
                 items = processor.process_items(items)
 
-        for item in items:
-            self._items.add(self._apply_matching_pipeline(item))
+        self._items.update(map_modifiers(self.matching_pipeline, items))
 
     def remove_items_from_iterable(self, items: Iterable[str]) -> None:
         """
@@ -265,6 +274,9 @@ class LookupTrie(LookupStructure):
         super().__init__(*args, **kwargs)
         self.children: dict[str, LookupTrie] = {}
         self.is_terminal = False
+        self.version = 0
+        """Incremented whenever an item is added, so derived structures can be
+        invalidated."""
 
     def add_item(self, item: Sequence[str]) -> None:
         """
@@ -274,17 +286,21 @@ class LookupTrie(LookupStructure):
             item: The item to be added.
         """
 
-        if len(item) == 0:
-            self.is_terminal = True
+        node = self
+
+        for element in item:
 
-        else:
+            node.version += 1
+            # node is always a LookupTrie, so accessing its own member is fine.
+            head = node._apply_matching_pipeline(element)  # pylint: disable=W0212
 
-            head, tail = self._apply_matching_pipeline(item[0]), item[1:]
+            if head not in node.children:
+                node.children[head] = LookupTrie()
 
-            if head not in self.children:
-                self.children[head] = LookupTrie()
+            node = node.children[head]
 
-            self.children[head].add_item(tail)
+        node.version += 1
+        node.is_terminal = True
 
     def __contains__(self, item: Sequence[str]) -> bool:
         """
@@ -4,9 +4,10 @@ import re
 import warnings
 
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass
-from typing import Iterable, Literal, Optional, Union
+from functools import lru_cache
+from typing import Iterable, Literal, Optional, Sequence, Union
 
 import docdeid.str
 from docdeid.annotation import Annotation
@@ -59,6 +60,23 @@ class SequencePattern:
 
 
 
+@lru_cache(maxsize=None)
+def _compile_re(pattern: str, flags: int = 0) -> re.Pattern:
+    """
+    Compiles a regexp, sharing the compiled pattern between all users of the same
+    pattern. Unlike the cache internal to ``re``, this one is not bounded, so it is
+    not flushed by pipelines that use many different patterns.
+
+    Args:
+        pattern: The regexp pattern.
+        flags: The regexp flags.
+
+    Returns:
+        The compiled pattern.
+    """
+    return re.compile(pattern, flags)
+
+
 class Annotator(DocProcessor, ABC):
     """
     Abstract class for annotators, which are responsible for generating annotations from
@@ -186,15 +204,20 @@ class SingleTokenLookupAnnotator(Annotator):
 
     def _tokens_to_annotations(self, tokens: Iterable[Token]) -> list[Annotation]:
 
+        tag = self.tag
+        priority = self.priority
+
+        # Positional arguments, in the order text, start_char, end_char, tag,
+        # priority, start_token, end_token.
         return [
             Annotation(
-                text=token.text,
-                start_char=token.start_char,
-                end_char=token.end_char,
-                tag=self.tag,
-                priority=self.priority,
-                start_token=token,
-                end_token=token,
+                token.text,
+                token.start_char,
+                token.end_char,
+                tag,
+                priority,
+                token,
+                token,
             )
             for token in tokens
         ]
@@ -210,6 +233,104 @@ class SingleTokenLookupAnnotator(Annotator):
         return self._tokens_to_annotations(annotate_tokens)
 
 
+class _TokenAutomaton:  # pylint: disable=R0903
+    """
+    An Aho-Corasick automaton over the token sequences contained in a
+    :class:`.LookupTrie`, so that all phrases can be found in a single pass over the
+    tokens. Tokens are interned to integer ids, on which the transitions are keyed.
+
+    Args:
+        trie: The `LookupTrie` to build the automaton from.
+    """
+
+    def __init__(self, trie: LookupTrie) -> None:
+        self.token_ids: dict[str, int] = {}
+        self.goto: list[dict[int, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.depth: list[int] = [0]
+        self.outputs: list[tuple[int, ...]] = [()]
+
+        queue: deque[tuple[LookupTrie, int]] = deque([(trie, 0)])
+
+        while queue:
+            node, state = queue.popleft()
+
+            for token, child in node.children.items():
+                token_id = self.token_ids.setdefault(token, len(self.token_ids))
+                child_state = len(self.goto)
+                self.goto[state][token_id] = child_state
+                self.goto.append({})
+                self.depth.append(self.depth[state] + 1)
+
+                fail_state = 0
+
+                if state != 0:
+                    fail_state = self.fail[state]
+
+                    while fail_state and token_id not in self.goto[fail_state]:
+                        fail_state = self.fail[fail_state]
+
+                    fail_state = self.goto[fail_state].get(token_id, 0)
+
+                self.fail.append(fail_state)
+
+                # The lengths of all phrases ending in this state, longest first.
+                outputs = self.outputs[fail_state]
+
+                if child.is_terminal:
+                    outputs = (self.depth[child_state],) + outputs
+
+                self.outputs.append(outputs)
+
+                queue.append((child, child_state))
+
+    def longest_matches(self, items: Sequence[str]) -> dict[int, int]:
+        """
+        Find the longest phrase starting at each position of a sequence of strings.
+
+        Args:
+            items: The input sequence of strings (e.g. token texts).
+
+        Returns:
+            A mapping from start index to the length of the longest phrase starting
+            at that index, for each index at which any phrase starts.
+        """
+
+        goto = self.goto
+        fail = self.fail
+        outputs = self.outputs
+        token_ids = self.token_ids
+
+        longest: dict[int, int] = {}
+        state = 0
+
+        for i, item in enumerate(items):
+
+            token_id = token_ids.get(item)
+
+            # Most tokens do not occur in any phrase, so there is no need to follow
+            # the failure links for them.
+            if token_id is None:
+                state = 0
+                continue
+
+            next_state = goto[state].get(token_id)
+
+            while next_state is None and state:
+                state = fail[state]
+                next_state = goto[state].get(token_id)
+
+            state = next_state or 0
+
+            for length in outputs[state]:
+                start_i = i - length + 1
+
+                if length > longest.get(start_i, 0):
+                    longest[start_i] = length
+
+        return longest
+
+
 class MultiTokenTrieAnnotator(Annotator):
     """
     Annotates entity mentions by looking them up in a `LookupTrie`.
@@ -231,50 +352,52 @@ class MultiTokenTrieAnnotator(Annotator):
 
         self._trie = trie
         self._overlapping = overlapping
-        self._start_words = set(trie.children)
+        self._start_words: Optional[set[str]] = None
+        self._automaton = _TokenAutomaton(trie)
+        self._automaton_version = trie.version
 
         super().__init__(*args, **kwargs)
 
     @property
     def start_words(self) -> set[str]:
         """First words of phrases detected by this annotator."""
-        # If the trie has been modified (added to) since we computed _start_words,
-        if len(self._start_words) != len(self._trie.children):
+        # If not computed yet, or the trie has been modified (added to) since,
+        if self._start_words is None or len(self._start_words) != len(
+            self._trie.children
+        ):
             # Recompute _start_words.
             self._start_words = set(self._trie.children)
         return self._start_words
 
+    def _get_automaton(self) -> _TokenAutomaton:
+        """The automaton matching the phrases in the trie."""
+        # If the trie has been modified (added to) since we built the automaton,
+        if self._automaton_version != self._trie.version:
+            # Rebuild it.
+            self._automaton = _TokenAutomaton(self._trie)
+            self._automaton_version = self._trie.version
+        return self._automaton
+
     def annotate(self, doc: Document) -> list[Annotation]:
 
         tokens = doc.get_tokens()
 
-        start_tokens = sorted(
-            tokens.token_lookup(
-                self.start_words, matching_pipeline=self._trie.matching_pipeline
-            ),
-            key=lambda token: token.start_char,
-        )
+        tokens_text = tokens.get_texts(self._trie.matching_pipeline)
 
-        start_indices = [tokens.token_index(token) for token in start_tokens]
+        longest_matches = self._get_automaton().longest_matches(tokens_text)
 
-        tokens_text = [token.text for token in tokens]
         annotations = []
         min_i = 0
 
-        for i in start_indices:
+        for i in sorted(longest_matches):
 
             if i < min_i:
                 continue
 
-            longest_matching_prefix = self._trie.longest_matching_prefix(
-                tokens_text, start_i=i
-            )
-
-            if longest_matching_prefix is None:
-                continue
+            match_length = longest_matches[i]
 
             start_token = tokens[i]
-            end_token = tokens[i + len(longest_matching_prefix) - 1]
+            end_token = tokens[i + match_length - 1]
 
             annotations.append(
                 Annotation(
@@ -289,7 +412,7 @@ class MultiTokenTrieAnnotator(Annotator):
             )
 
             if not self._overlapping:
-                min_i = i + len(longest_matching_prefix)  # skip ahead
+                min_i = i + match_length  # skip ahead
 
         return annotations
 
@@ -355,12 +478,17 @@ class RegexpAnnotator(Annotator):
 
     Args:
         regexp_pattern: A pattern, either as a `str` or a ``re.Pattern``, that will
-            be used for matching.
+            be used for matching. Any precompiled pattern object that mimics the
+            ``re.Pattern`` interface (e.g. from ``google-re2``) can be used as well,
+            as only its ``finditer`` method is called.
         capturing_group: The capturing group of the pattern that should be used to
             produce the annotation. By default, the entire match is used.
         pre_match_words: A list of words (lookup values), of which at least one must
             be present in the tokens for the annotator to start matching the regexp
             at all.
+        requires_digits: Whether the pattern can only match text that contains a
+            digit. If so, the regexp is not matched at all against documents without
+            any digits.
     """
 
     def __init__(
@@ -369,14 +497,16 @@ class RegexpAnnotator(Annotator):
         *args,
         capturing_group: int = 0,
         pre_match_words: Optional[list[str]] = None,
+        requires_digits: bool = False,
         **kwargs,
     ) -> None:
 
         if isinstance(regexp_pattern, str):
-            regexp_pattern = re.compile(regexp_pattern)
+            regexp_pattern = _compile_re(regexp_pattern)
 
         self.regexp_pattern = regexp_pattern
         self.capturing_group = capturing_group
+        self.requires_digits = requires_digits
 
         self.pre_match_words: Optional[set[str]] = None
         self.matching_pipeline: Optional[list[StringModifier]] = None
@@ -394,6 +524,9 @@ class RegexpAnnotator(Annotator):
 
     def annotate(self, doc: Document) -> list[Annotation]:
 
+        if self.requires_digits and not doc.has_digits:
+            return []
+
         if self.pre_match_words is not None:
             try:
                 if (
@@ -447,12 +580,20 @@ class TokenPatternAnnotator(Annotator):
         if not self.pattern.doc_precondition(doc):
             return annotations
 
+        # Bind to locals, as these are looked up for every token.
+        token_precondition = self.pattern.token_precondition
+        match_pattern = self.pattern.match
+        text = doc.text
+        metadata = doc.metadata
+        tag = self.tag
+        priority = self.priority
+
         for token in doc.get_tokens():
 
-            if not self.pattern.token_precondition(token):
+            if not token_precondition(token):
                 continue
 
-            match = self.pattern.match(token, doc.metadata)
+            match = match_pattern(token, metadata)
 
             if match is None:
                 continue
@@ -461,11 +602,11 @@ class TokenPatternAnnotator(Annotator):
 
             annotations.append(
                 Annotation(
-                    text=doc.text[start_token.start_char : end_token.end_char],
+                    text=text[start_token.start_char : end_token.end_char],
                     start_char=start_token.start_char,
                     end_char=end_token.end_char,
-                    tag=self.tag,
-                    priority=self.priority,
+                    tag=tag,
+                    priority=priority,
                     start_token=start_token,
                     end_token=end_token,
                 )
@@ -501,7 +642,7 @@ class _PatternPositionMatcher:  # pylint: disable=R0903
         if func == "equal":
             return kwargs["token"].text == value
         if func == "re_match":
-            return re.match(value, kwargs["token"].text) is not None
+            return _compile_re(value).match(kwargs["token"].text) is not None
         if func == "is_initial":
 
             warnings.warn(
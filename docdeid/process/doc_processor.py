@@ -1,13 +1,19 @@
 import logging
+import os
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import Iterator, Optional, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Iterable, Iterator, Optional, Union
 
 from docdeid.document import Document
 from docdeid.utils import annotate_doc
 
 _ROOT_LOGGER = logging.getLogger()
 
+_WORKER_GROUP: Optional["DocProcessorGroup"] = None
+"""The group used by :meth:`.DocProcessorGroup.process_many` in a worker process."""
+
 
 class DocProcessor(ABC):  # pylint: disable=R0903
     """Something that processes a document."""
@@ -150,6 +156,101 @@ class DocProcessorGroup:
             if _ROOT_LOGGER.isEnabledFor(logging.DEBUG):
                 logging.debug("after %s: %s", name, annotate_doc(doc))
 
+    def process_many(  # pylint: disable=R0913
+        self,
+        docs: Iterable[Document],
+        n_workers: Optional[int] = None,
+        use_threads: bool = False,
+        enabled: Optional[set[str]] = None,
+        disabled: Optional[set[str]] = None,
+    ) -> list[Document]:
+        """
+        Process many documents in parallel, by passing each of them to this group's
+        processors.
+
+        By default, documents are processed in worker processes, each of which holds
+        its own copy of this group. The documents are then pickled to and from the
+        workers, so the returned documents are copies, and their annotations no
+        longer refer to tokens. With ``use_threads``, documents are processed in
+        place by threads sharing this group instead, which only pays off if the
+        processors release the GIL (e.g. mostly :class:`.RegexpAnnotator`).
+
+        Args:
+            docs: The documents to be processed.
+            n_workers: The number of worker processes or threads. Defaults to the
+                number of CPUs.
+            use_threads: Whether to use threads rather than processes.
+            enabled: A set of strings, indicating which document processors to run.
+                See :meth:`.DocProcessorGroup.process`.
+            disabled: A set of strings, indicating which document processors not to
+                run. See :meth:`.DocProcessorGroup.process`.
+
+        Returns:
+            The processed documents, in the same order as ``docs``.
+        """
+
+        docs = list(docs)
+        n_workers = n_workers or os.cpu_count() or 1
+
+        if use_threads:
+            process_doc = partial(
+                _process_doc, group=self, enabled=enabled, disabled=disabled
+            )
+
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                return list(executor.map(process_doc, docs))
+
+        process_doc = partial(_process_doc, enabled=enabled, disabled=disabled)
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers, initializer=_install_group, initargs=(self,)
+        ) as executor:
+            return list(
+                executor.map(
+                    process_doc,
+                    docs,
+                    chunksize=max(1, len(docs) // (4 * n_workers)),
+                )
+            )
+
     def __iter__(self) -> Iterator:
 
         return iter(self._processors.items())
+
+
+def _install_group(group: DocProcessorGroup) -> None:
+    """
+    Installs the group that a worker process uses to process documents.
+
+    Args:
+        group: The document processor group.
+    """
+    global _WORKER_GROUP  # pylint: disable=W0603
+    _WORKER_GROUP = group
+
+
+def _process_doc(
+    doc: Document,
+    group: Optional[DocProcessorGroup] = None,
+    enabled: Optional[set[str]] = None,
+    disabled: Optional[set[str]] = None,
+) -> Document:
+    """
+    Processes a single document for :meth:`.DocProcessorGroup.process_many`.
+
+    Args:
+        doc: The document to be processed.
+        group: The document processor group, or ``None`` to use the group installed
+            in this worker process.
+        enabled: The document processors to run.
+        disabled: The document processors not to run.
+
+    Returns:
+        The processed document.
+    """
+    if group is None:
+        assert _WORKER_GROUP is not None, "No group installed in this worker."
+        group = _WORKER_GROUP
+
+    group.process(doc, enabled=enabled, disabled=disabled)
+    return doc
@@ -1,9 +1,8 @@
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from operator import attrgetter
 
-from frozendict import frozendict
-
-from docdeid.annotation import Annotation, AnnotationSet
+from docdeid.annotation import AnnotationSet
 from docdeid.document import Document
 from docdeid.process.doc_processor import DocProcessor
 
@@ -88,95 +87,41 @@ class SimpleRedactor(Redactor):
         self.close_char = close_char
         self.check_overlap = check_overlap
 
-    @staticmethod
-    def _group_annotations_by_tag(
-        annotations: AnnotationSet,
-    ) -> dict[str, list[Annotation]]:
-        """
-        Group annotations by tag.
-
-        Args:
-            annotations: A set of annotations.
-
-        Returns:
-            A dict mapping each tag in the :class:`.AnnotationSet` to the Annotations.
-        """
-
-        groups = defaultdict(list)
-
-        for annotation in annotations:
-            groups[annotation.tag].append(annotation)
-
-        return groups
-
-    @staticmethod
-    def _replace_annotations_in_text(
-        text: str, annotations: AnnotationSet, replacement: dict[Annotation, str]
-    ) -> str:
-        """
-        Replaces each annotation in the text with the string defined in ``replacement``
-        mapping.
-
-        Args:
-            text: The original input text.
-            annotations: The original set of input annotations.
-            replacement: A mapping from :class:`.Annotation` to its string replacment.
-
-        Returns:
-            The text, with each annotation replaced by its defined replacement.
-        """
-
-        sorted_annotations = annotations.sorted(
-            by=("end_char",), callbacks=frozendict(end_char=lambda x: -x)
-        )
-
-        for annotation in sorted_annotations:
-
-            text = (
-                text[: annotation.start_char]
-                + replacement[annotation]
-                + text[annotation.end_char :]
-            )
-
-        return text
-
     def redact(self, text: str, annotations: AnnotationSet) -> str:
-        if self.check_overlap and annotations.has_overlap():
-            raise ValueError(
-                f"{self.__class__} received input with overlapping annotations."
-            )
+        open_char = self.open_char
+        close_char = self.close_char
 
-        annotation_text_to_counter: dict[str, int] = {}
+        text_to_counter_by_tag: defaultdict[str, dict[str, int]] = defaultdict(dict)
+        tag_prefixes: dict[str, str] = {}
+        chunks = []
+        last_idx = 0
 
-        for _, annotation_group in self._group_annotations_by_tag(annotations).items():
+        for annotation in sorted(annotations, key=attrgetter("start_char", "end_char")):
 
-            annotation_text_to_counter_group: dict[str, int] = {}
+            if self.check_overlap and annotation.start_char < last_idx:
+                raise ValueError(
+                    f"{self.__class__} received input with overlapping annotations."
+                )
 
-            annotation_group = sorted(
-                annotation_group, key=lambda a: a.get_sort_key(by=("end_char",))
+            tag = annotation.tag
+            text_to_counter = text_to_counter_by_tag[tag]
+            counter = text_to_counter.setdefault(
+                annotation.text, len(text_to_counter) + 1
             )
 
-            for annotation in annotation_group:
-
-                if annotation.text not in annotation_text_to_counter_group:
-                    annotation_text_to_counter_group[annotation.text] = (
-                        len(annotation_text_to_counter_group) + 1
-                    )
+            prefix = tag_prefixes.get(tag)
 
-            annotation_text_to_counter |= annotation_text_to_counter_group
+            if prefix is None:
+                prefix = tag_prefixes[tag] = f"{open_char}{tag.upper()}-"
 
-        annotation_replacement = {}
+            # Without the overlap check, annotations may be nested. Never move back,
+            # so text that was already replaced is not emitted again.
+            if annotation.start_char >= last_idx:
+                chunks.append(text[last_idx : annotation.start_char])
 
-        for annotation in annotations:
+            chunks.append(f"{prefix}{counter}{close_char}")
+            last_idx = max(last_idx, annotation.end_char)
 
-            annotation_replacement[annotation] = (
-                f"{self.open_char}"
-                f"{annotation.tag.upper()}"
-                f"-"
-                f"{annotation_text_to_counter[annotation.text]}"
-                f"{self.close_char}"
-            )
+        chunks.append(text[last_idx:])
 
-        return self._replace_annotations_in_text(
-            text, annotations, annotation_replacement
-        )
+        return "".join(chunks)
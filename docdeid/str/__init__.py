@@ -10,4 +10,6 @@ from .processor import (
     StringModifier,
     StringProcessor,
     StripString,
+    compose_modifiers,
+    map_modifiers,
 )
@@ -1,7 +1,10 @@
 import re
 import unicodedata
 from abc import ABC, abstractmethod
-from typing import Iterable
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, Optional
+
+_NORMALIZE_CACHE_SIZE = 2**16
 
 
 class StringProcessor(ABC):
@@ -44,7 +47,7 @@ class StringModifier(StringProcessor, ABC):
         """
 
     def process_items(self, items: Iterable[str]) -> list[str]:
-        return [self.process(item) for item in items]
+        return list(map(self.process, items))
 
 
 class StringFilter(StringProcessor, ABC):
@@ -73,6 +76,9 @@ class LowercaseString(StringModifier):
     def process(self, item: str) -> str:
         return item.casefold()
 
+    def process_items(self, items: Iterable[str]) -> list[str]:
+        return list(map(str.casefold, items))
+
 
 _WORD_RX = re.compile("\\w+", re.U)
 
@@ -92,6 +98,10 @@ class LowercaseTail(StringModifier):
         return word
 
     def process(self, item: str) -> str:
+        # Without any uppercase characters, no word can be all uppercase.
+        if item.islower():
+            return item
+
         return _WORD_RX.sub(self._process_word_match, item)
 
 
@@ -105,6 +115,9 @@ class StripString(StringModifier):
     def process(self, item: str) -> str:
         return item.strip()
 
+    def process_items(self, items: Iterable[str]) -> list[str]:
+        return list(map(str.strip, items))
+
 
 class RemoveNonAsciiCharacters(StringModifier):
     """
@@ -114,10 +127,10 @@ class RemoveNonAsciiCharacters(StringModifier):
     """
 
     @staticmethod
+    @lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
     def _normalize_value(text: str) -> str:
         """Removes all non-ascii characters from a string."""
-        text = str(bytes(text, encoding="ascii", errors="ignore"), encoding="ascii")
-        return unicodedata.normalize("NFKD", text)
+        return text.encode("ascii", "ignore").decode("ascii")
 
     def process(self, item: str) -> str:
         return self._normalize_value(item)
@@ -132,11 +145,11 @@ class ReplaceNonAsciiCharacters(StringModifier):
     """
 
     @staticmethod
+    @lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
     def _normalize_value(text: str) -> str:
         text = unicodedata.normalize("NFD", text)
-        text = text.encode("ascii", "ignore").decode("utf-8")
 
-        return str(text)
+        return text.encode("ascii", "ignore").decode("ascii")
 
     def process(self, item: str) -> str:
         return self._normalize_value(item)
@@ -189,3 +202,82 @@ class FilterByLength(StringFilter):
 
     def filter(self, item: str) -> bool:
         return len(item) >= self.min_len
+
+
+def _identity(item: str) -> str:
+    return item
+
+
+class _ComposedModifiers:  # pylint: disable=R0903
+    """Applies a sequence of string modifying functions in order."""
+
+    def __init__(self, funcs: list[Callable[[str], str]]) -> None:
+        self._funcs = tuple(funcs)
+
+    def __call__(self, item: str) -> str:
+        for func in self._funcs:
+            item = func(item)
+
+        return item
+
+
+def _modifier_funcs(
+    modifiers: Optional[Iterable[StringModifier]],
+) -> list[Callable[[str], str]]:
+    return [
+        # An exact type check, as subclasses may override process.
+        str.casefold
+        if type(modifier) is LowercaseString  # pylint: disable=C0123
+        else modifier.process
+        for modifier in modifiers or []
+    ]
+
+
+def compose_modifiers(
+    modifiers: Optional[Iterable[StringModifier]],
+) -> Callable[[str], str]:
+    """
+    Composes a pipeline of :class:`.StringModifier` into a single callable, so that
+    applying it to many strings does not iterate the pipeline and look up each
+    ``process`` method for every string.
+
+    Args:
+        modifiers: The string modifiers, in the order they should be applied. May be
+            ``None`` or empty, in which case strings are returned unmodified.
+
+    Returns:
+        A callable that applies all modifiers to a string.
+    """
+
+    funcs = _modifier_funcs(modifiers)
+
+    if len(funcs) == 0:
+        return _identity
+
+    if len(funcs) == 1:
+        return funcs[0]
+
+    return _ComposedModifiers(funcs)
+
+
+def map_modifiers(
+    modifiers: Optional[Iterable[StringModifier]], items: Iterable[str]
+) -> Iterator[str]:
+    """
+    Lazily applies a pipeline of :class:`.StringModifier` to each of the items. The
+    modifiers are chained as ``map`` iterators, so the items are processed in a single
+    pass without intermediate lists.
+
+    Args:
+        modifiers: The string modifiers, in the order they should be applied. May be
+            ``None`` or empty, in which case the items are returned unmodified.
+        items: The input items.
+
+    Returns:
+        An iterator over the modified items.
+    """
+
+    for func in _modifier_funcs(modifiers):
+        items = map(func, items)
+
+    return iter(items)
@@ -9,7 +9,10 @@ from dataclasses import dataclass, field
 from typing import Literal, Optional, SupportsIndex, overload
 
 from docdeid.direction import Direction
-from docdeid.str import StringModifier
+from docdeid.str import StringModifier, map_modifiers
+
+_NON_WHITESPACE_RX = re.compile(r"\S+")
+_WORD_BOUNDARY_RX = re.compile(r"\b")
 
 
 @dataclass(frozen=True)
@@ -158,12 +161,13 @@ class TokenList(Sequence[Token]):
 
     def __init__(self, tokens: list[Token], link_tokens: bool = True) -> None:
         self._tokens = tokens
-        self._token_index = {token: i for i, token in enumerate(tokens)}
+        self._token_index: Optional[dict[Token, int]] = None
 
         if link_tokens:
             self._link_tokens()
 
         self._words: dict[str, set[str]] = {}
+        self._texts: dict[str, list[str]] = {}
         self._text_to_tokens: dict[str, defaultdict[str, list[Token]]] = {}
 
     def _link_tokens(self) -> None:
@@ -172,6 +176,20 @@ class TokenList(Sequence[Token]):
             self._tokens[i].set_next_token(self._tokens[i + 1])
             self._tokens[i + 1].set_previous_token(self._tokens[i])
 
+    def _get_token_index(self) -> dict[Token, int]:
+        """
+        Get the mapping from token to its index in this list. Evaluates lazily, as
+        most documents never need it.
+
+        Returns:
+            A dict mapping each token to its index.
+        """
+
+        if self._token_index is None:
+            self._token_index = {token: i for i, token in enumerate(self._tokens)}
+
+        return self._token_index
+
     def token_index(self, token: Token) -> int:
         """
         Find the token index in this list, i.e. its nominal position in the list.
@@ -181,30 +199,60 @@ class TokenList(Sequence[Token]):
 
         Returns: The index in this tokenlist.
         """
-        return self._token_index[token]
+        return self._get_token_index()[token]
 
     def _init_token_lookup(
-        self, matching_pipeline: Optional[list[StringModifier]] = None
+        self, matching_pipeline: list[StringModifier], pipe_key: str
     ) -> None:
 
-        matching_pipeline = matching_pipeline or []
+        text_to_tokens = defaultdict(list)
+
+        texts = list(
+            map_modifiers(matching_pipeline, (token.text for token in self._tokens))
+        )
+
+        for token, text in zip(self._tokens, texts):
+            text_to_tokens[text].append(token)
+
+        self._texts[pipe_key] = texts
+        self._words[pipe_key] = set(text_to_tokens)
+        self._text_to_tokens[pipe_key] = text_to_tokens
+
+    def _get_pipe_key(self, matching_pipeline: list[StringModifier]) -> str:
+        """
+        Get the key under which the words and tokens for a matching pipeline are
+        cached, initializing the cache if needed.
+
+        Args:
+            matching_pipeline: The matching pipeline to apply.
+
+        Returns:
+            The cache key for the matching pipeline.
+        """
+
         pipe_key = str(matching_pipeline)
 
-        words = set()
-        text_to_tokens = defaultdict(list)
+        if pipe_key not in self._words:
+            self._init_token_lookup(matching_pipeline, pipe_key)
 
-        for token in self._tokens:
+        return pipe_key
 
-            text = token.text
+    def get_texts(
+        self, matching_pipeline: Optional[list[StringModifier]] = None
+    ) -> list[str]:
+        """
+        Get the texts of the tokens in this ``TokenList``, in order. Evaluates lazily.
+
+        Args:
+            matching_pipeline: The matching pipeline to apply.
 
-            for string_modifier in matching_pipeline:
-                text = string_modifier.process(text)
+        Returns:
+            The text of each token, modified by the matching pipeline.
+        """
 
-            words.add(text)
-            text_to_tokens[text].append(token)
+        pipe_key = self._get_pipe_key(matching_pipeline or [])
 
-        self._words[pipe_key] = words
-        self._text_to_tokens[pipe_key] = text_to_tokens
+        return self._texts[pipe_key]
 
     def get_words(
         self, matching_pipeline: Optional[list[StringModifier]] = None
@@ -219,11 +267,7 @@ class TokenList(Sequence[Token]):
             All the words in this ``TokenList`` as a set of strings.
         """
 
-        matching_pipeline = matching_pipeline or []
-        pipe_key = str(matching_pipeline)
-
-        if pipe_key not in self._words:
-            self._init_token_lookup(matching_pipeline)
+        pipe_key = self._get_pipe_key(matching_pipeline or [])
 
         return self._words[pipe_key]
 
@@ -244,17 +288,13 @@ class TokenList(Sequence[Token]):
             A set of ``Token``, of which the text matches one of the lookup values.
         """
 
-        matching_pipeline = matching_pipeline or []
-        pipe_key = str(matching_pipeline)
-
-        if pipe_key not in self._text_to_tokens:
-            self._init_token_lookup(matching_pipeline)
+        pipe_key = self._get_pipe_key(matching_pipeline or [])
+        text_to_tokens = self._text_to_tokens[pipe_key]
 
         tokens = set()
-        words = self.get_words(matching_pipeline)
 
-        for word in words.intersection(lookup_values):
-            tokens.update(self._text_to_tokens[pipe_key][word])
+        for word in self._words[pipe_key].intersection(lookup_values):
+            tokens.update(text_to_tokens[word])
 
         return tokens
 
@@ -284,7 +324,7 @@ class TokenList(Sequence[Token]):
         __stop: SupportsIndex = sys.maxsize,
     ) -> int:
         try:
-            return self._token_index[__token]
+            return self._get_token_index()[__token]
         except KeyError:
             # Raise a plain ValueError, just like list.index.
             # pylint: disable=W0707
@@ -374,7 +414,7 @@ class SpaceSplitTokenizer(Tokenizer):  # pylint: disable=R0903
     def _split_text(self, text: str) -> list[Token]:
         return [
             Token(text=match.group(0), start_char=match.start(), end_char=match.end())
-            for match in re.finditer(r"\S+", text)
+            for match in _NON_WHITESPACE_RX.finditer(text)
         ]
 
 
@@ -393,7 +433,7 @@ class WordBoundaryTokenizer(Tokenizer):  # pylint: disable=R0903
 
     def _split_text(self, text: str) -> list[Token]:
         tokens = []
-        matches = [*re.finditer(r"\b", text)]
+        matches = [*_WORD_BOUNDARY_RX.finditer(text)]
 
         for start_match, end_match in zip(matches, matches[1:]):
 
@@ -1,9 +1,7 @@
-from collections import defaultdict
 from collections.abc import Generator, Iterable, Iterator, Mapping
+from operator import attrgetter
 from typing import Any, Optional
 
-from frozendict import frozendict
-
 from docdeid.document import Document
 
 
@@ -33,6 +31,25 @@ def __leaf_items(obj: Any, par_key: Optional[str]) -> Generator[tuple, None, Non
         yield par_key, obj
 
 
+def _tag_markup(tag: str, cache: dict[str, tuple[str, str]]) -> tuple[str, str]:
+    """
+    Get the opening and closing markup for a tag, i.e. ``<TAG>`` and ``</TAG>``.
+
+    Args:
+        tag: The annotation tag.
+        cache: The markup computed so far, which is updated in place.
+
+    Returns:
+        The opening and closing markup.
+    """
+    markup = cache.get(tag)
+
+    if markup is None:
+        markup = cache[tag] = (f"<{tag.upper()}>", f"</{tag.upper()}>")
+
+    return markup
+
+
 def annotate_intext(doc: Document) -> str:
     """
     Annotate intext, which can be useful to compare the annotations of two different
@@ -46,22 +63,26 @@ def annotate_intext(doc: Document) -> str:
     Returns:
         A string with each annotated span replaced with ``<TAG>text</TAG>``.
     """
-    annotations = doc.annotations.sorted(
-        by=("end_char",),
-        callbacks=frozendict(end_char=lambda x: -x),
-    )
+    chunks = []
+    last_idx = 0
+    markup_cache: dict[str, tuple[str, str]] = {}
 
-    text = doc.text
+    annotations = sorted(doc.annotations, key=attrgetter("start_char", "end_char"))
 
     for annotation in annotations:
+        open_tag, close_tag = _tag_markup(annotation.tag, markup_cache)
 
-        text = (
-            f"{text[:annotation.start_char]}"
-            f"<{annotation.tag.upper()}>{annotation.text}</{annotation.tag.upper()}>"
-            f"{text[annotation.end_char:]}"
-        )
+        # Nested annotations must not move the cursor back, which would emit text
+        # again that is already part of an enclosing annotation.
+        if annotation.start_char >= last_idx:
+            chunks.append(doc.text[last_idx : annotation.start_char])
 
-    return text
+        chunks.append(f"{open_tag}{annotation.text}{close_tag}")
+        last_idx = max(last_idx, annotation.end_char)
+
+    chunks.append(doc.text[last_idx:])
+
+    return "".join(chunks)
 
 
 def annotate_doc(doc: Document) -> str:
@@ -71,21 +92,23 @@ def annotate_doc(doc: Document) -> str:
     Handles also nested mentions and in a way also overlapping mentions, even though
     this kind of markup cannot really represent them.
     """
-    annos_from_shortest = doc.annotations.sorted(by=("length", ))
-    idx_to_anno_starts = defaultdict(list)
-    idx_to_anno_ends = defaultdict(list)
-    for anno in annos_from_shortest:
-        idx_to_anno_starts[anno.start_char].append(anno)
-        idx_to_anno_ends[anno.end_char].append(anno)
-    markup_indices = sorted(set(idx_to_anno_starts).union(idx_to_anno_ends))
+    # Events are ordered by offset, closing tags before opening tags, closing inner
+    # annotations first and opening outer annotations first.
+    events = []
+    markup_cache: dict[str, tuple[str, str]] = {}
+    for rank, anno in enumerate(
+        sorted(doc.annotations, key=attrgetter("length", "priority", "tag", "text"))
+    ):
+        open_tag, close_tag = _tag_markup(anno.tag, markup_cache)
+        events.append((anno.end_char, 0, rank, close_tag))
+        events.append((anno.start_char, 1, -rank, open_tag))
+    events.sort()
+
     chunks = []
     last_idx = 0
-    for idx in markup_indices:
+    for idx, _, _, markup in events:
         chunks.append(doc.text[last_idx:idx])
-        for ending_anno in idx_to_anno_ends[idx]:
-            chunks.append(f"</{ending_anno.tag.upper()}>")
-        for starting_anno in reversed(idx_to_anno_starts[idx]):
-            chunks.append(f"<{starting_anno.tag.upper()}>")
+        chunks.append(markup)
         last_idx = idx
     chunks.append(doc.text[last_idx:])
     return "".join(chunks)
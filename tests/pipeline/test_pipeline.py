@@ -2,6 +2,7 @@ import pytest
 
 from docdeid.annotation import Annotation, AnnotationSet
 from docdeid.deidentifier import DocDeid
+from docdeid.document import Document
 from docdeid.ds import LookupTrie
 from docdeid.process.annotator import (
     MultiTokenLookupAnnotator,
@@ -155,3 +156,40 @@ class TestDeidentify:
 
         assert doc.annotations == expected_annotations
         assert doc.deidentified_text == expected_text
+
+    @pytest.mark.parametrize("use_threads", [False, True])
+    def test_process_many(self, short_text, long_text, use_threads):
+        deidentifier = DocDeid()
+        tokenizer = SpaceSplitTokenizer()
+        deidentifier.tokenizers["default"] = tokenizer
+        deidentifier.processors.add_processor(
+            "name_annotator",
+            SingleTokenLookupAnnotator(lookup_values=["Bob"], tag="name"),
+        )
+        loc_trie = LookupTrie()
+        loc_trie.add_item("the United States of America".split())
+        deidentifier.processors.add_processor(
+            "location_annotator",
+            MultiTokenLookupAnnotator(
+                trie=loc_trie,
+                tag="location",
+            ),
+        )
+        deidentifier.processors.add_processor("redactor", SimpleRedactor())
+
+        docs = [
+            Document(text, tokenizers=deidentifier.tokenizers)
+            for text in (short_text, long_text)
+        ]
+
+        docs = deidentifier.processors.process_many(
+            docs, n_workers=2, use_threads=use_threads
+        )
+
+        assert [doc.deidentified_text for doc in docs] == [
+            "Hello my name is [NAME-1]",
+            "Hello my name is [NAME-1] and I live in [LOCATION-1]",
+        ]
+        assert docs[1].annotations.sorted(by=("start_char",))[0] == Annotation(
+            text="Bob", start_char=17, end_char=20, tag="name"
+        )
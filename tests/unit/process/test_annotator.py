@@ -77,6 +77,22 @@ class TestMultiTokenLookupAnnotator:
 
         assert annotations == expected_annotations
 
+    def test_multi_token_after_trie_update(self, long_text, long_tokenlist):
+        doc = Document(long_text)
+        my_trie = LookupTrie()
+        my_trie.add_item(("my", " ", "wife"))
+        annotator = MultiTokenLookupAnnotator(trie=my_trie, tag="prefix")
+
+        with patch.object(doc, "get_tokens", return_value=long_tokenlist):
+            annotator.annotate(doc)
+            my_trie.add_item(("My", " ", "name"))
+            annotations = annotator.annotate(doc)
+
+        assert annotations == [
+            Annotation(text="My name", start_char=0, end_char=7, tag="prefix"),
+            Annotation(text="my wife", start_char=39, end_char=46, tag="prefix"),
+        ]
+
     def test_multi_token_with_matching_pipeline(self, long_text, long_tokenlist):
         doc = Document(long_text)
 
@@ -139,6 +155,24 @@ class TestMultiTokenLookupAnnotator:
 
         assert annotations == expected_annotations
 
+    def test_multi_token_lookup_shared_infix(self, long_text):
+        doc = Document(long_text, tokenizers={"default": SpaceSplitTokenizer()})
+        trie = LookupTrie()
+        trie.add_item(("is", "dr.", "Jones"))
+        trie.add_item(("dr.", "John"))
+        trie.add_item(("dr.", "John", "Smith,"))
+        trie.add_item(("John", "Smith,", "please", "meet"))
+        annotator = MultiTokenLookupAnnotator(trie=trie, tag="name", overlapping=True)
+
+        expected_annotations = [
+            Annotation(text="dr. John Smith,", start_char=11, end_char=26, tag="name"),
+            Annotation(
+                text="John Smith, please meet", start_char=15, end_char=38, tag="name"
+            ),
+        ]
+
+        assert annotator.annotate(doc) == expected_annotations
+
     def test_multi_token_lookup_with_trie(self, long_text, long_tokenlist):
 
         doc = Document(long_text)
@@ -223,6 +257,13 @@ class TestRegexpAnnotator:
 
         assert annotations == expected_annotations
 
+    def test_regexp_annotator_shares_compiled_pattern(self):
+        annotator_1 = RegexpAnnotator(regexp_pattern=r"[A-Z][a-z]+", tag="one")
+        re.purge()
+        annotator_2 = RegexpAnnotator(regexp_pattern=r"[A-Z][a-z]+", tag="two")
+
+        assert annotator_1.regexp_pattern is annotator_2.regexp_pattern
+
     def test_regexp_annotator_with_group(self, long_text):
         doc = Document(long_text)
         annotator = RegexpAnnotator(
@@ -254,6 +295,21 @@ class TestRegexpAnnotator:
         with patch.object(annotator, "_validate_match", return_value=False):
             assert annotator.annotate(doc) == []
 
+    def test_regexp_requires_digits(self, long_text):
+
+        annotator = RegexpAnnotator(
+            regexp_pattern=r"\d+", tag="number", requires_digits=True
+        )
+
+        with patch.object(annotator, "regexp_pattern") as regexp_pattern:
+            assert annotator.annotate(Document(long_text)) == []
+
+        regexp_pattern.finditer.assert_not_called()
+
+        assert annotator.annotate(Document("Room 12")) == [
+            Annotation(text="12", start_char=5, end_char=7, tag="number")
+        ]
+
 
 class TestTokenPatternAnnotator:
     @patch("docdeid.pattern.TokenPattern.__abstractmethods__", set())
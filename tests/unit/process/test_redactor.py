@@ -1,3 +1,5 @@
+import pytest
+
 from docdeid.annotation import Annotation, AnnotationSet
 from docdeid.process.redactor import RedactAllText, SimpleRedactor
 
@@ -67,3 +69,64 @@ class TestSimpleRedactor:
         deidentified_text = redactor.redact(text, annotations)
 
         assert deidentified_text == "Hello I'm [NAME-1], and I live in [LOCATION-1]"
+
+    def test_redact_adjacent_annotations(self):
+        text = "BobRita"
+        annotations = AnnotationSet(
+            [
+                Annotation(text="Bob", start_char=0, end_char=3, tag="name"),
+                Annotation(text="Rita", start_char=3, end_char=7, tag="name"),
+            ]
+        )
+        redactor = SimpleRedactor()
+
+        deidentified_text = redactor.redact(text, annotations)
+
+        assert deidentified_text == "[NAME-1][NAME-2]"
+
+    def test_redact_same_text_different_tag(self):
+        text = "Bob lives on Rita Street, Rita lives on Bob Street"
+        annotations = AnnotationSet(
+            [
+                Annotation(text="Bob", start_char=0, end_char=3, tag="name"),
+                Annotation(text="Rita", start_char=13, end_char=17, tag="street"),
+                Annotation(text="Rita", start_char=26, end_char=30, tag="name"),
+                Annotation(text="Bob", start_char=40, end_char=43, tag="street"),
+            ]
+        )
+        redactor = SimpleRedactor()
+
+        deidentified_text = redactor.redact(text, annotations)
+
+        assert deidentified_text == (
+            "[NAME-1] lives on [STREET-1] Street, [NAME-2] lives on [STREET-2] Street"
+        )
+
+    def test_redact_overlapping_annotations(self):
+        text = "Hello I'm Bob Smith"
+        annotations = AnnotationSet(
+            [
+                Annotation(text="Bob Smith", start_char=10, end_char=19, tag="name"),
+                Annotation(text="Smith", start_char=14, end_char=19, tag="name"),
+            ]
+        )
+        redactor = SimpleRedactor()
+
+        with pytest.raises(ValueError):
+            redactor.redact(text, annotations)
+
+    def test_redact_nested_annotations_without_overlap_check(self):
+        text = "Patient Johnathan Smith here"
+        annotations = AnnotationSet(
+            [
+                Annotation(
+                    text="Johnathan Smith", start_char=8, end_char=23, tag="name"
+                ),
+                Annotation(text="atha", start_char=12, end_char=16, tag="x"),
+            ]
+        )
+        redactor = SimpleRedactor(check_overlap=False)
+
+        deidentified_text = redactor.redact(text, annotations)
+
+        assert deidentified_text == "Patient [NAME-1][X-1] here"
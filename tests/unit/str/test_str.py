@@ -1,11 +1,14 @@
 from docdeid.str.processor import (
     FilterByLength,
     LowercaseString,
+    LowercaseTail,
     RemoveNonAsciiCharacters,
     ReplaceNonAsciiCharacters,
     ReplaceValue,
     ReplaceValueRegexp,
     StripString,
+    compose_modifiers,
+    map_modifiers,
 )
 
 
@@ -16,6 +19,20 @@ class TestStringModifier:
         assert proc.process("albert") == "albert"
         assert proc.process("Albert") == "albert"
 
+    def test_lowercase_string_items(self):
+        proc = LowercaseString()
+
+        assert proc.process_items(["albert", "Albert"]) == ["albert", "albert"]
+
+    def test_lowercase_tail(self):
+        proc = LowercaseTail()
+
+        assert proc.process("jan jansen") == "jan jansen"
+        assert proc.process("JAN JANSEN") == "Jan Jansen"
+        assert proc.process("IJSSELSTEIN, Utrecht") == "IJsselstein, Utrecht"
+        assert LowercaseTail(lang="en").process("IJSSEL") == "Ijssel"
+        assert proc.process("123") == "123"
+
     def test_strip_string(self):
         proc = StripString()
 
@@ -23,6 +40,11 @@ class TestStringModifier:
         assert proc.process(" test") == "test"
         assert proc.process("test\n") == "test"
 
+    def test_strip_string_items(self):
+        proc = StripString()
+
+        assert proc.process_items([" test", "test\n"]) == ["test", "test"]
+
     def test_remove_non_ascii(self):
         proc = RemoveNonAsciiCharacters()
 
@@ -64,3 +86,30 @@ class TestStringFilter:
         assert not proc.filter("test")
         assert proc.filter("12345")
         assert proc.filter("longer phrase")
+
+
+class TestComposeModifiers:
+    def test_compose_empty(self):
+        assert compose_modifiers(None)("Test ") == "Test "
+        assert compose_modifiers([])("Test ") == "Test "
+
+    def test_compose_single(self):
+        assert compose_modifiers([LowercaseString()])("Test ") == "test "
+        assert compose_modifiers([StripString()])("Test ") == "Test"
+
+    def test_compose_multiple(self):
+        apply_pipeline = compose_modifiers(
+            [StripString(), LowercaseString(), ReplaceValue("t", "b")]
+        )
+
+        assert apply_pipeline(" Test ") == "besb"
+
+
+class TestMapModifiers:
+    def test_map_empty(self):
+        assert list(map_modifiers(None, ["Test "])) == ["Test "]
+
+    def test_map_multiple(self):
+        items = map_modifiers([StripString(), LowercaseString()], [" Test", "Bob "])
+
+        assert list(items) == ["test", "bob"]
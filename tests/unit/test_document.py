@@ -62,6 +62,10 @@ class TestDocument:
         for annotation in annotations:
             assert annotation in doc.annotations
 
+    def test_has_digits(self):
+        assert Document("Room 12").has_digits
+        assert not Document("Room twelve").has_digits
+
     @patch("docdeid.tokenizer.Tokenizer.__abstractmethods__", set())
     def test_get_tokens(self, short_tokens):
         text = "Hello I'm Bob"
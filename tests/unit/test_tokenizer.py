@@ -110,6 +110,31 @@ class TestTokenList:
 
         assert token_list.get_words(matching_pipeline) == {"hello", "i'm", "bob"}
 
+    def test_get_texts(self, short_tokens):
+
+        token_list = TokenList(short_tokens)
+        matching_pipeline = [docdeid.str.LowercaseString()]
+
+        assert token_list.get_texts() == ["Hello", "I'm", "Bob"]
+        assert token_list.get_texts(matching_pipeline) == ["hello", "i'm", "bob"]
+
+    def test_get_words_cached_per_pipeline(self, short_tokens):
+
+        token_list = TokenList(short_tokens)
+        words = token_list.get_words([docdeid.str.LowercaseString()])
+
+        with patch.object(
+            TokenList, "_init_token_lookup", wraps=token_list._init_token_lookup
+        ) as init_token_lookup:
+            assert token_list.get_words([docdeid.str.LowercaseString()]) is words
+            assert token_list.token_lookup(
+                {"bob"}, matching_pipeline=[docdeid.str.LowercaseString()]
+            ) == {short_tokens[2]}
+            init_token_lookup.assert_not_called()
+
+            token_list.get_words([docdeid.str.StripString()])
+            init_token_lookup.assert_called_once()
+
     def test_token_lookup(self, long_tokens):
 
         token_list = TokenList(long_tokens)
@@ -1,5 +1,5 @@
 from docdeid import Annotation, Document
-from docdeid.utils import annotate_intext
+from docdeid.utils import annotate_doc, annotate_intext
 
 
 class TestAnnotateIntext:
@@ -18,3 +18,39 @@ class TestAnnotateIntext:
         )
 
         assert annotate_intext(doc) == expected_text
+
+    def test_annotate_intext_nested(self):
+        text = "Patient Johnathan Smith here"
+        doc = Document(text=text)
+        doc.annotations.add(
+            Annotation(text="Johnathan Smith", start_char=8, end_char=23, tag="name")
+        )
+        doc.annotations.add(
+            Annotation(text="atha", start_char=12, end_char=16, tag="x")
+        )
+
+        expected_text = "Patient <NAME>Johnathan Smith</NAME><X>atha</X> here"
+
+        assert annotate_intext(doc) == expected_text
+
+
+class TestAnnotateDoc:
+    def test_annotate_doc_nested(self):
+        text = "Patient John Smith lives in Japan"
+        doc = Document(text=text)
+        doc.annotations.add(
+            Annotation(text="John Smith", start_char=8, end_char=18, tag="name")
+        )
+        doc.annotations.add(
+            Annotation(text="John", start_char=8, end_char=12, tag="first_name")
+        )
+        doc.annotations.add(
+            Annotation(text="Japan", start_char=28, end_char=33, tag="location")
+        )
+
+        expected_text = (
+            "Patient <NAME><FIRST_NAME>John</FIRST_NAME> Smith</NAME> lives in "
+            "<LOCATION>Japan</LOCATION>"
+        )
+
+        assert annotate_doc(doc) == expected_text